@@ -0,0 +1,455 @@
+# 키마 세팅 클래스
+import contextlib
+import struct
+import threading
+
+import serial
+import serial.tools.list_ports
+
+
+class Keymouse():
+    # Mouse basic commands and arguments
+    MOUSE_CMD = 0xE0
+    MOUSE_CALIBRATE = 0xE1
+    MOUSE_PRESS = 0xE2
+    MOUSE_RELEASE = 0xE3
+
+    MOUSE_CLICK = 0xE4
+    MOUSE_FAST_CLICK = 0xE5
+    MOUSE_MOVE = 0xE6
+    MOUSE_BEZIER = 0xE7
+
+    # Mouse buttons
+    MOUSE_LEFT = 0xEA
+    MOUSE_RIGHT = 0xEB
+    MOUSE_MIDDLE = 0xEC
+    MOUSE_BUTTONS = frozenset({MOUSE_LEFT,
+                               MOUSE_MIDDLE,
+                               MOUSE_RIGHT})
+
+    # Keyboard commands and arguments
+    KEYBOARD_CMD = 0xF0
+    KEYBOARD_PRESS = 0xF1
+    KEYBOARD_RELEASE = 0xF2
+    KEYBOARD_RELEASE_ALL = 0xF3
+    KEYBOARD_PRINT = 0xF4
+    KEYBOARD_PRINTLN = 0xF5
+    KEYBOARD_WRITE = 0xF6
+    KEYBOARD_TYPE = 0xF7
+
+    # Arduino keyboard modifiers
+    # http://arduino.cc/en/Reference/KeyboardModifiers
+    LEFT_CTRL = 0x80
+    LEFT_SHIFT = 0x81
+    LEFT_ALT = 0x82
+    LEFT_GUI = 0x83
+    RIGHT_CTRL = 0x84
+    RIGHT_SHIFT = 0x85
+    RIGHT_ALT = 0x86
+    RIGHT_GUI = 0x87
+    UP_ARROW = 0xDA
+    DOWN_ARROW = 0xD9
+    LEFT_ARROW = 0xD8
+    RIGHT_ARROW = 0xD7
+    BACKSPACE = 0xB2
+    TAB = 0xB3
+    RETURN = 0xB0
+    ESC = 0xB1
+    INSERT = 0xD1
+    DELETE = 0xD4
+    PAGE_UP = 0xD3
+    PAGE_DOWN = 0xD6
+    HOME = 0xD2
+    END = 0xD5
+    CAPS_LOCK = 0xC1
+    F1 = 0xC2
+    F2 = 0xC3
+    F3 = 0xC4
+    F4 = 0xC5
+    F5 = 0xC6
+    F6 = 0xC7
+    F7 = 0xC8
+    F8 = 0xC9
+    F9 = 0xCA
+    F10 = 0xCB
+    F11 = 0xCC
+    F12 = 0xCD
+
+    # etc.
+    SCREEN_CALIBRATE = 0xFF
+    COMMAND_COMPLETE = 0xFE
+
+
+# accepted mouse coordinate types
+_NUMBER = (int, float)
+
+
+# 아두이노 제어 클래스
+
+class Arduino(object):
+    def __init__(self, port=None, baudrate=115200):
+        """
+		Args:
+		  port (str, optional): Device name or port number number or None.
+		  baudrate (str, optional): Baud rate such as 9600 or 115200 etc.
+
+		Raises:
+		  SerialException: In the case the device cannot be found.
+
+		Note:
+		  You should not have to specify any arguments when instantiating
+		  this class. The default parameters should work out of the box.
+
+		  However, if the constructor is unable to automatically identify
+		  the Arduino device, a port name should be explicitly specified.
+
+		  If you specify a baud rate other than the default 115200 baud, you
+		  must modify the arduino sketch to match the specified baud rate.
+		"""
+
+        if port is None:
+            port = self.__detect_port()
+
+        self.serial = serial.Serial(port, baudrate)
+        if not self.serial.isOpen():
+            raise serial.SerialException("Arduino device not found.")
+
+        # only the Windows backend of pyserial can resize the driver queues
+        if hasattr(self.serial, "set_buffer_size"):
+            self.serial.set_buffer_size(rx_size=65536, tx_size=65536)
+
+        # bytes waiting to be sent, flushed with a single write
+        self.__tx = bytearray()
+        # main.py drives one Arduino from several threads, so queuing and
+        # flushing commands is serialized
+        self.__lock = threading.RLock()
+        # precompiled format, so the hot path skips struct's format lookup
+        self.__pack_point = struct.Struct("<HH").pack
+        # every mouse button command is static, so build them all up front
+        self.__mouse_commands = {
+            (command, button): bytes((Keymouse.MOUSE_CMD, command, button))
+            for command in (Keymouse.MOUSE_PRESS, Keymouse.MOUSE_RELEASE,
+                            Keymouse.MOUSE_CLICK, Keymouse.MOUSE_FAST_CLICK)
+            for button in Keymouse.MOUSE_BUTTONS
+        }
+        self.__move_header = bytes((Keymouse.MOUSE_CMD, Keymouse.MOUSE_MOVE))
+        self.__bezier_header = bytes((Keymouse.MOUSE_CMD, Keymouse.MOUSE_BEZIER))
+        self.__keyboard_press = bytes((Keymouse.KEYBOARD_CMD, Keymouse.KEYBOARD_PRESS))
+        self.__keyboard_release = bytes((Keymouse.KEYBOARD_CMD, Keymouse.KEYBOARD_RELEASE))
+        self.__keyboard_write = bytes((Keymouse.KEYBOARD_CMD, Keymouse.KEYBOARD_WRITE))
+        self.__keyboard_print = bytes((Keymouse.KEYBOARD_CMD, Keymouse.KEYBOARD_PRINT))
+        self.__keyboard_println = bytes((Keymouse.KEYBOARD_CMD, Keymouse.KEYBOARD_PRINTLN))
+        self.__keyboard_release_all = bytes((Keymouse.KEYBOARD_CMD, Keymouse.KEYBOARD_RELEASE_ALL))
+
+        # number of commands queued inside pipeline(), None outside of it
+        self.__pipelined = None
+        # completions owed by pipeline(wait=False), taken over by the next
+        # blocking call
+        self.__unacknowledged = 0
+
+        # released once per COMMAND_COMPLETE byte from the Arduino
+        # all module calls are blocking until the Arduino command is complete
+        # a semaphore keeps the signal even if it arrives before the wait
+        self.__command_complete = threading.Semaphore(0)
+
+        # read and parse bytes from the serial buffer until close()
+        self.__stop = threading.Event()
+        self.__serial_reader = threading.Thread(target=self.__read_buffer)
+        self.__serial_reader.daemon = True
+        self.__serial_reader.start()
+
+    def press(self, button=Keymouse.MOUSE_LEFT):
+        # exact type checks are cheaper than the isinstance chain
+        kind = type(button)
+        if kind is int:
+            if button in Keymouse.MOUSE_BUTTONS:
+                command = self.__mouse_commands[Keymouse.MOUSE_PRESS, button]
+            else:
+                command = self.__keyboard_press + self.__encode_byte(button)
+
+        elif kind is str and len(button) == 1:
+            command = self.__keyboard_press + self.__encode_char(button)
+
+        else:
+            raise ValueError("Not a valid mouse or keyboard button.")
+
+        self.__send(command)
+
+    def release(self, button=Keymouse.MOUSE_LEFT):
+        kind = type(button)
+        if kind is int:
+            if button in Keymouse.MOUSE_BUTTONS:
+                command = self.__mouse_commands[Keymouse.MOUSE_RELEASE, button]
+            else:
+                command = self.__keyboard_release + self.__encode_byte(button)
+
+        elif kind is str and len(button) == 1:
+            command = self.__keyboard_release + self.__encode_char(button)
+
+        else:
+            raise ValueError("Not a valid mouse or keyboard button.")
+
+        self.__send(command)
+
+    def release_all(self):
+        self.__send(self.__keyboard_release_all)
+
+    def write(self, keys, endl=False):
+        kind = type(keys)
+        if kind is int:
+            command = self.__keyboard_write + self.__encode_byte(keys)
+
+        elif kind is str and len(keys) == 1:
+            command = self.__keyboard_write + self.__encode_char(keys)
+
+        elif kind is str:
+            text = self.__encode_str(keys)
+            if not endl:
+                command = self.__keyboard_print + text
+            else:
+                command = self.__keyboard_println + text
+
+        else:
+            raise ValueError(
+                "Not a valid keyboard keystroke. "
+                + "Must be type `int` or `char` or `str`."
+            )
+
+        self.__send(command)
+
+    def type(self, message, wpm=80, mistakes=True, accuracy=96):
+        # argument checks are skipped when running under `python -O`
+        if __debug__:
+            if not isinstance(message, str):
+                raise ValueError("Invalid keyboard message. " + "Must be type `str`.")
+
+            if not (isinstance(wpm, int) and 1 <= wpm <= 255):
+                raise ValueError(
+                    "Invalid value for `WPM`. " + "Must be type `int`: 1 <= WPM <= 255."
+                )
+
+            if not isinstance(mistakes, bool):
+                raise ValueError("Invalid value for `mistakes`. " + "Must be type `bool`.")
+
+            if not (isinstance(accuracy, int) and 1 <= accuracy <= 100):
+                raise ValueError(
+                    "Invalid value for `accuracy`. "
+                    + "Must be type `int`: 1 <= accuracy <= 100."
+                )
+
+        # header, NUL-terminated message and typing options in one command,
+        # built before queuing so a bad value under -O leaves no bytes behind
+        command = (
+            bytes((Keymouse.KEYBOARD_CMD, Keymouse.KEYBOARD_TYPE))
+            + self.__encode_str(message)
+            + bytes((wpm, int(mistakes), accuracy))
+        )
+
+        self.__send(command)
+
+    def click(self, button=Keymouse.MOUSE_LEFT):
+        if button not in Keymouse.MOUSE_BUTTONS:
+            raise ValueError("Not a valid mouse button.")
+
+        command = self.__mouse_commands[Keymouse.MOUSE_CLICK, button]
+
+        self.__send(command)
+
+    def fast_click(self, button):
+        if button not in Keymouse.MOUSE_BUTTONS:
+            raise ValueError("Not a valid mouse button.")
+
+        command = self.__mouse_commands[Keymouse.MOUSE_FAST_CLICK, button]
+
+        self.__send(command)
+
+    def move(self, dest_x, dest_y):
+        if not isinstance(dest_x, _NUMBER) or not isinstance(dest_y, _NUMBER):
+            raise ValueError(
+                "Invalid mouse coordinates. " + "Must be type `int` or `float`."
+            )
+
+        command = self.__move_header + self.__encode_point(dest_x, dest_y)
+
+        self.__send(command, barrier=True)
+
+    def bezier_move(self, dest_x, dest_y):
+        if not isinstance(dest_x, _NUMBER) or not isinstance(dest_y, _NUMBER):
+            raise ValueError(
+                "Invalid mouse coordinates. " + "Must be `int` or `float`."
+            )
+
+        command = self.__bezier_header + self.__encode_point(dest_x, dest_y)
+
+        self.__send(command, barrier=True)
+
+    @contextlib.contextmanager
+    def pipeline(self, wait=True):
+        """
+		Queue commands and send them to the Arduino in a single serial write.
+
+		Args:
+		  wait (bool, optional): Block on exit until every queued command is
+		    complete. Otherwise the next blocking call sends its own command
+		    and then waits for those completions along with its own.
+
+		Note:
+		  move() and bezier_move() need a calibration round trip with the
+		  Arduino, so inside a pipeline they flush the queue and block as usual.
+
+		  If the block raises, every command still queued is discarded.
+
+		  The pipeline holds the command lock, so commands from other threads
+		  wait until the block ends instead of joining the batch.
+
+		Example:
+		  with ardu.pipeline():
+		      ardu.press(Keymouse.LEFT_ALT)
+		      ardu.release(Keymouse.LEFT_ALT)
+		"""
+
+        with self.__lock:
+            # a nested pipeline just joins the outer one
+            if self.__pipelined is not None:
+                yield self
+                return
+
+            self.__pipelined = 0
+            try:
+                yield self
+            except BaseException:
+                # never send a press without its release
+                self.__tx.clear()
+                self.__pipelined = None
+                raise
+
+            self.__unacknowledged += self.__pipelined
+            self.__pipelined = None
+            owed = self.__take_unacknowledged() if wait else 0
+            self.__flush()
+
+        self.__wait(owed)
+
+    def close(self):
+        self.__stop.set()
+        self.serial.close()
+        self.__serial_reader.join(timeout=1)
+        return True
+
+    def __detect_port(self):
+        ports = serial.tools.list_ports.comports()
+
+        # the first matching device wins
+        return next(
+            (port.device for port in ports if "Arduino" in (port.description or "")),
+            None,
+        )
+
+    def __read_buffer(self):
+        try:
+            while not self.__stop.is_set():
+                # take everything already received, or block for the next byte
+                data = self.serial.read(max(1, self.serial.in_waiting))
+
+                for byte in data:
+                    if byte == Keymouse.MOUSE_CALIBRATE:
+                        self.__calibrate_mouse()
+
+                    elif byte == Keymouse.SCREEN_CALIBRATE:
+                        self.__calibrate_screen()
+
+                    elif byte == Keymouse.COMMAND_COMPLETE:
+                        self.__command_complete.release()
+
+        except (serial.SerialException, OSError):
+            pass
+
+        finally:
+            # no more completions will arrive, so wake any blocked caller
+            self.__stop.set()
+            self.__command_complete.release()
+
+    def __calibrate_screen(self):
+        # pywin32 is only needed once the Arduino asks for calibration
+        from win32api import GetSystemMetrics
+
+        width, height = GetSystemMetrics(0), GetSystemMetrics(1)
+
+        # answered from the reader thread, so bypass the command buffer
+        self.serial.write(self.__pack_point(width, height))
+
+    def __calibrate_mouse(self):
+        from win32api import GetCursorPos
+
+        x, y = GetCursorPos()
+
+        self.serial.write(self.__pack_point(x, y))
+
+    def __encode_str(self, string):
+        # encoded before any header byte is queued, so a bad string
+        # leaves the command buffer untouched
+        try:
+            return string.encode("latin-1") + b"\x00"
+        except UnicodeEncodeError:
+            raise ValueError(
+                "Invalid keyboard string. " + "Must only contain Latin-1 characters."
+            ) from None
+
+    def __encode_point(self, x, y):
+        # packed before the header is queued, so a bad point leaves no bytes
+        try:
+            return self.__pack_point(int(x), int(y))
+        except struct.error:
+            raise ValueError(
+                "Invalid mouse coordinates. " + "Must be in range 0 <= x, y <= 65535."
+            ) from None
+
+    def __encode_char(self, char):
+        # same early check as __encode_str, without the terminator
+        return self.__encode_str(char)[:1]
+
+    def __encode_byte(self, byte):
+        # range checked before the header is queued
+        if not 0 <= byte <= 255:
+            raise ValueError(
+                "Not a valid keyboard key. " + "Must be type `int`: 0 <= key <= 255."
+            )
+        return bytes((byte,))
+
+    def __send(self, command, barrier=False):
+        with self.__lock:
+            self.__tx += command
+
+            # inside pipeline() the command just stays queued in the buffer
+            if self.__pipelined is not None and not barrier:
+                self.__pipelined += 1
+                return
+
+            # a barrier also takes over the commands queued before it
+            if self.__pipelined:
+                self.__unacknowledged += self.__pipelined
+                self.__pipelined = 0
+
+            owed = 1 + self.__take_unacknowledged()
+            self.__flush()
+
+        self.__wait(owed)
+
+    def __take_unacknowledged(self):
+        # called with the lock held; the caller now waits for these
+        owed, self.__unacknowledged = self.__unacknowledged, 0
+        return owed
+
+    def __wait(self, count):
+        # each caller acquires exactly the completions it took on, so
+        # concurrent callers can never steal each other's wakeups
+        for _ in range(count):
+            self.__command_complete.acquire()
+            if self.__stop.is_set():
+                # pass the wakeup on to the next waiter before giving up
+                self.__command_complete.release()
+                raise serial.SerialException("Arduino connection closed.")
+
+    def __flush(self):
+        self.serial.write(bytes(self.__tx))
+        self.__tx.clear()